@@ -7,12 +7,11 @@ and statistics using interactive tables and plots.
 Imports:
     - Dash, html, dash_table, dcc: Components for building the Dash web application.
     - plotly.io as pio: Sets default plot style.
-    - json: Handles reading and parsing league data.
-    - fetch_data: Fetches and processes league data.
+    - data_store.DATA: League data fetched once and shared across modules.
     - callbacks.register_callbacks: Registers callback functions for interactive updates.
 
 Workflow:
-    1. Fetch and load league standings from `data.json`.
+    1. Fetch and load league standings from `data.json` (via `data_store`).
     2. Initialize a Dash application with:
         - A dropdown to select a season.
         - A table displaying league standings with conditional formatting.
@@ -34,18 +33,8 @@ Usage:
 
 from dash import Dash, html, dash_table, dcc
 import plotly.io as pio
-import json
-import fetch_data
-from callbacks import register_callbacks
-import os.path
-
-# Prevents the program from continuously fetching data
-data_file_path = "data.json"
-if not os.path.exists(data_file_path):
-    fetch_data.main()
-
-with open(data_file_path, "r") as f:
-    data = json.load(f)
+from data_store import DATA as data
+from callbacks import register_callbacks, create_scatter_fig, create_bar_fig
 
 seasons = list(data.keys())
 
@@ -55,6 +44,9 @@ table_glossary = {"Played": "GP", "Won": "W", "Drawn": "D", "Lost": "L", "Goals
                   "Goals Against": "GA", "Goal Difference": "GD"}
 
 pio.templates.default = "plotly_white"
+# Serialize figures with orjson instead of stdlib json; the image-heavy
+# figures returned from the callbacks encode several times faster.
+pio.json.config.default_engine = "orjson"
 
 main_style = {
     "padding": "10px",
@@ -135,7 +127,9 @@ app.layout = html.Div(children=[
 
         # Bar Plot Section
         html.Div(children=[
-            dcc.Graph(id="bar-plot"),
+            # Full initial figures are rendered here once; the callbacks then
+            # patch only the changed parts of the figures.
+            dcc.Graph(id="bar-plot", figure=create_bar_fig("Points", seasons[0])),
 
             html.Div(children=[
                 html.P("y-axis:"),
@@ -151,7 +145,7 @@ app.layout = html.Div(children=[
 
         # Scatter Plot Section
         html.Div(children=[
-            dcc.Graph(id="scatter-plot"),
+            dcc.Graph(id="scatter-plot", figure=create_scatter_fig("Goals For", "Goals Against", seasons[0])),
 
             html.Div(children=[
                 html.P("x-axis:"),
@@ -5,7 +5,7 @@ This script provides functions and callbacks to generate an interactive dashboar
 football league standings and statistics using Dash and Plotly.
 
 Imports:
-    - json: For reading the 'data.json' file.
+    - data_store.SEASON_ARRAYS: The standings data in a columnar per-season layout.
     - pandas as pd: For data manipulation and creating league tables.
     - plotly.express as px: For generating scatter and bar plots.
     - dash.dependencies (Input, Output): For defining Dash callbacks.
@@ -13,29 +13,34 @@ Imports:
 Functions:
     - create_form(value): Generates an HTML string displaying images for match results.
     - create_club_label(club, badge_url): Creates an HTML label with a club's name and badge.
-    - create_table_df(season): Constructs a DataFrame representing the league table.
+    - create_table_records(season): Builds the league table rows directly as a list of records.
     - create_columns_list(columns): Defines column properties for the league table.
     - create_plot_df(season): Creates a DataFrame for plotting and maps clubs to badge URLs.
-    - create_cond(col, query, color, max_value=None, min_value=None): 
+    - create_cond(col, query, color, max_value=None, min_value=None):
         Generates a conditional formatting rule for table styling.
-    - create_style_conds(df): Creates conditional formatting rules based on performance metrics.
+    - create_style_conds(season): Creates conditional formatting rules based on performance metrics.
+    - create_axis_ranges(df, x_axis, y_axis): Computes explicit scatter plot axis ranges.
+    - create_scatter_images(x_axis, y_axis, season): Builds the scatter plot badge image list.
+    - create_bar_images(bar_variable, season): Builds the bar plot badge image list.
+    - create_scatter_fig(x_axis, y_axis, season): Builds the scatter plot figure with club badges.
+    - create_bar_fig(bar_variable, season): Builds the bar plot figure with club badges.
+    - create_fig_patch(fig): Converts a figure into a partial `dash.Patch` update.
     - register_callbacks(app): Registers Dash callbacks for updating tables and plots dynamically.
 
 Dash Callbacks:
     - update_table(selected_season): Updates the league standings table.
-    - update_scatter_plot(x_axis, y_axis, selected_season): Creates a scatter plot of selected metrics.
-    - update_barplot(bar_variable, selected_season): Generates a bar chart with club badges.
+    - update_scatter_plot(x_axis, y_axis, selected_season): Patches the scatter plot for the selected metrics.
+    - update_barplot(bar_variable, selected_season): Patches the bar chart for the selected variable.
 """
 
 
-import json
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from dash import Patch
 from dash.dependencies import Input, Output
-
-data_file_path = "data.json"
-with open(data_file_path, "r") as f:
-    data = json.load(f)
+from flask_caching import Cache
+from data_store import SEASON_ARRAYS
 
 plot_columns = ["Won", "Drawn", "Lost", "Goals For", "Goals Against", "Points"]
 
@@ -52,11 +57,11 @@ def create_form(value):
     """
 
     style = "display: flex; justify-content: center; align-items: center;"
-    form = f"<div style='{style}'>"
     width = 25
-    for char in value:
-        form += f"<img src='assets/{char.lower()}.png' width={width} style='margin: 2px'>"
-    return form + '</div>'
+    # Joining a list avoids the quadratic += string concatenation pattern
+    images = ''.join(f"<img src='assets/{char.lower()}.png' width={width} style='margin: 2px'>"
+                     for char in value)
+    return f"<div style='{style}'>{images}</div>"
 
 def create_club_label(club, badge_url):
     """
@@ -74,15 +79,19 @@ def create_club_label(club, badge_url):
     img_attributes = "width='30' height='30' style=margin-right: 10px"
     return f"<div style='{div_style}'><img src='{badge_url}' {img_attributes}><p>{club}</p></div>"
 
-def create_table_df(season):
+def create_table_records(season):
     """
-    Creates a Pandas DataFrame representing a league table for a given season.
+    Builds the standings table rows for a season directly as a list of records.
+
+    The DataTable consumes a list of dicts anyway, so routing the data through
+    a DataFrame just to call `to_dict('records')` would pay for construction,
+    insert, and rename passes that a direct build avoids entirely.
 
     Args:
         season (str): The season identifier used to retrieve data.
 
     Returns:
-        pd.DataFrame: A DataFrame containing league table data with the following columns:
+        list of dict: One record per club containing:
             - Position: The ranking position of the club.
             - Club: The club name along with its badge.
             - GP (Played): Number of games played.
@@ -96,33 +105,24 @@ def create_table_df(season):
             - Form: Recent match results represented as images.
 
     Notes:
-        - The function extracts data for the given season from `data`.
-        - It calculates the "Goal Difference" column as "Goals For" minus "Goals Against."
-        - The "Form" column is converted into an HTML representation using `create_form()`.
-        - The "Club" column is formatted with club labels and badges using `create_club_label()`.
-        - The final table uses shorthand column names for clarity.
+        - The "Form" values already contain the HTML rendered once at load time by `create_form()`.
+        - The "Club" values are formatted with club labels and badges using `create_club_label()`.
     """
 
-    columns = ["badge_url", "club", "played", "won", "drawn", "lost", 
-               "goals for", "goals against", "points", "form"]
-
-    df = pd.DataFrame({
-        "Position": [int(x) for x in list(data[season].keys())],
-        **{k.title(): [v[k] for v in data[season].values()] for k in columns}
-    })
-    idx = df.columns.get_loc("Goals Against") + 1
-    df.insert(idx, "Goal Difference", df["Goals For"] - df["Goals Against"])
-
-    df["Form"] = df["Form"].apply(lambda row: create_form(row))
-    df["Club"] = df.apply(lambda x: create_club_label(x.Club, x.Badge_Url), axis=1)
-
-    df = df.drop(columns=["Badge_Url"])
-    table_glossary = {"Played": "GP", "Won": "W", "Drawn": "D", 
-                      "Lost": "L", "Goals For": "GF", "Goals Against": "GA", 
-                      "Goal Difference": "GD"}
-    df = df.rename(columns=table_glossary)
-
-    return df
+    arrays = SEASON_ARRAYS[season]
+    club_labels = [create_club_label(club, url)
+                   for club, url in zip(arrays["club"], arrays["badge_url"])]
+    goal_diff = arrays["goals for"] - arrays["goals against"]
+    return [
+        {"Position": pos, "Club": label, "GP": played, "W": won, "D": drawn,
+         "L": lost, "GF": gf, "GA": ga, "GD": gd, "Points": points, "Form": form}
+        for pos, label, played, won, drawn, lost, gf, ga, gd, points, form in zip(
+            arrays["position"].tolist(), club_labels, arrays["played"].tolist(),
+            arrays["won"].tolist(), arrays["drawn"].tolist(), arrays["lost"].tolist(),
+            arrays["goals for"].tolist(), arrays["goals against"].tolist(),
+            goal_diff.tolist(), arrays["points"].tolist(), arrays["form"]
+        )
+    ]
 
 def create_columns_list(columns):
     """
@@ -167,22 +167,25 @@ def create_plot_df(season):
             - dict: A dictionary mapping club names to their badge URLs.
 
     Notes:
-        - The function extracts data for the given season from `data`.
+        - The function builds the DataFrame from the given season's columns in `SEASON_ARRAYS`.
         - It calculates the "Goal Difference" column as "Goals For" minus "Goals Against."
-        - The "Badge_Url" column is removed from the DataFrame and stored separately in the returned dictionary.
+        - The badge URLs never enter the DataFrame; they are returned separately in the dictionary.
     """
-    columns = ["badge_url", "club", "played", "won", "drawn", 
+    columns = ["club", "played", "won", "drawn",
                "lost", "goals for", "goals against", "points"]
 
+    # The badge mapping comes straight from the season arrays, so the badge
+    # column never enters the frame and no drop() copy is needed. Both plot
+    # callbacks share this one frame via PLOT_CACHE.
+    arrays = SEASON_ARRAYS[season]
     df = pd.DataFrame({
-        "Position": list(data[season].keys()),
-        **{k.title(): [v[k] for v in data[season].values()] for k in columns}
+        "Position": arrays["position"],
+        **{k.title(): arrays[k] for k in columns}
     })
-    df["Goal Difference"] =  df["Goals For"] - df["Goals Against"]
+    df["Goal Difference"] = arrays["goals for"] - arrays["goals against"]
+
+    badges = dict(zip(arrays["club"], arrays["badge_url"]))
 
-    badges = dict(zip(df["Club"], df["Badge_Url"]))
-    df = df.drop(columns=["Badge_Url"])
-    
     return df, badges
 
 def create_cond(col, query, color, max_value=None, min_value=None):
@@ -230,12 +233,12 @@ def create_cond(col, query, color, max_value=None, min_value=None):
 
     return {'if': {'filter_query': query_map[query], 'column_id': col}, 'backgroundColor': color}
 
-def create_style_conds(df):
+def create_style_conds(season):
     """
     Generates a list of conditional formatting rules for a DataTable based on performance metrics.
 
     Args:
-        df (pd.DataFrame): The DataFrame containing league table data.
+        season (str): The season identifier used to retrieve data.
 
     Returns:
         list of dict: A list of conditional formatting rules, where each rule is a dictionary specifying:
@@ -268,8 +271,14 @@ def create_style_conds(df):
 
     style_conditions = []
 
-    max_values = df.max().to_dict()
-    min_values = df.min().to_dict()
+    # Only reduce the columns the rules actually use; the raw season arrays
+    # give the numeric columns without any HTML string scanning.
+    arrays = SEASON_ARRAYS[season]
+    column_arrays = {"W": arrays["won"], "GF": arrays["goals for"],
+                     "GD": arrays["goals for"] - arrays["goals against"],
+                     "L": arrays["lost"], "GA": arrays["goals against"]}
+    max_values = {col: int(values.max()) for col, values in column_arrays.items()}
+    min_values = {col: int(values.min()) for col, values in column_arrays.items()}
 
     def add_style_conditions(columns, best_query, worst_query, best_color, worst_color):
         for col in columns:
@@ -291,6 +300,219 @@ def create_style_conds(df):
 
     return style_conditions
 
+def create_axis_ranges(df, x_axis, y_axis):
+    """
+    Computes explicit axis ranges for a scatter plot of two columns.
+
+    Setting the ranges manually is what makes the conversion to
+    paper-relative coordinates possible for the badge images.
+
+    Args:
+        df (pd.DataFrame): The plot DataFrame for a season.
+        x_axis (str): The column plotted on the x-axis.
+        y_axis (str): The column plotted on the y-axis.
+
+    Returns:
+        tuple: The (range_x, range_y) lists with a 10% margin on either side.
+    """
+
+    range_x = [int(0.9*df[x_axis].min()), int(1.1*df[x_axis].max())]
+    range_y = [int(0.9*df[y_axis].min()), int(1.1*df[y_axis].max())]
+    return range_x, range_y
+
+def create_scatter_images(x_axis, y_axis, season):
+    """
+    Builds the badge image list for one scatter plot input combination.
+
+    Args:
+        x_axis (str): The column plotted on the x-axis.
+        y_axis (str): The column plotted on the y-axis.
+        season (str): The season identifier used to retrieve data.
+
+    Returns:
+        list of dict: One paper-positioned layout image per club.
+    """
+
+    df, badges = PLOT_CACHE[season]
+    x_range, y_range = create_axis_ranges(df, x_axis, y_axis)
+
+    # Function to convert data coordinates to paper-relative coordinates.
+    # An all-zero column (e.g. "Drawn" in the opening weeks of a season)
+    # yields a degenerate [0, 0] range; clamping the span to 1 avoids a
+    # ZeroDivisionError while the image caches are built at import.
+    def to_paper_coords(x_data, y_data, x_range, y_range):
+        x_span = max(x_range[1] - x_range[0], 1)
+        y_span = max(y_range[1] - y_range[0], 1)
+        x_paper = (x_data - x_range[0]) / x_span
+        y_paper = (y_data - y_range[0]) / y_span
+        return x_paper, y_paper
+
+    # Build the images list in one go and assign it once; add_layout_image
+    # validates and mutates the figure on every single call.
+    paper_coords = (to_paper_coords(x, y, x_range, y_range)
+                    for x, y in zip(df[x_axis], df[y_axis]))
+    return [
+        dict(
+            source=badges[club],
+            x=x, y=y,
+            xref="paper", yref="paper",
+            sizex=0.1, sizey=0.1,
+            xanchor="center", yanchor="middle",
+            layer="above"
+        )
+        for club, (x, y) in zip(df["Club"], paper_coords)
+    ]
+
+def create_bar_images(bar_variable, season):
+    """
+    Builds the badge image list for one bar plot input combination.
+
+    Args:
+        bar_variable (str): The column plotted on the y-axis.
+        season (str): The season identifier used to retrieve data.
+
+    Returns:
+        list of dict: One layout image per club, placed just above its bar.
+    """
+
+    df, badges = PLOT_CACHE[season]
+    max_y = df[bar_variable].max()
+    badge_size = max_y*0.1
+
+    return [
+        dict(
+            source=badges[club],
+            x=club,  # The bars are positioned by club name
+            y=y + max_y*0.01,  # Slightly above the bar
+            xref="x", yref="y",
+            sizex=badge_size, sizey=badge_size,
+            xanchor="center", yanchor="bottom",
+            layer="above"
+        )
+        for club, y in zip(df["Club"], df[bar_variable])
+    ]
+
+def create_scatter_fig(x_axis, y_axis, season):
+    """
+    Creates a scatter plot figure of two selected metrics with club badges.
+
+    Args:
+        x_axis (str): The column plotted on the x-axis.
+        y_axis (str): The column plotted on the y-axis.
+        season (str): The season identifier used to retrieve data.
+
+    Returns:
+        dict: The scatter plot in JSON-ready dict form, with a club badge
+        image positioned at each data point.
+    """
+
+    df, badges = PLOT_CACHE[season]
+    range_x, range_y = create_axis_ranges(df, x_axis, y_axis)
+
+    fig = px.scatter(
+        df, x=x_axis, y=y_axis,
+        range_x = range_x, range_y = range_y,
+        title=f'Scatter Plot of <b>{x_axis}</b> vs <b>{y_axis}</b>',
+        height=600,
+        render_mode="webgl",  # GPU-accelerated rendering instead of SVG nodes
+        )
+
+    fig.update_traces(
+        marker=dict(opacity=0),
+        hoverinfo="none",
+        hovertemplate=f"<b>%{{customdata}}</b><br>{x_axis}: %{{x}}<br>{y_axis}: %{{y}}<extra></extra>",
+        customdata=df["Club"]
+        )
+
+    fig.update_layout(images=SCATTER_IMAGES_CACHE[(x_axis, y_axis, season)])
+
+    # Cache the JSON-ready dict, not the Figure: repeated requests then skip
+    # plotly's graph-object validation and conversion entirely.
+    return fig.to_plotly_json()
+
+def create_bar_fig(bar_variable, season):
+    """
+    Creates a bar plot figure of a selected metric with club badges above the bars.
+
+    Args:
+        bar_variable (str): The column plotted on the y-axis.
+        season (str): The season identifier used to retrieve data.
+
+    Returns:
+        dict: The bar plot in JSON-ready dict form, with a club badge image
+        placed above each bar.
+    """
+
+    df, badges = PLOT_CACHE[season]
+    fig = px.bar(
+        df, x="Club", y=bar_variable,
+        title=f'Bar Plot of <b>{bar_variable}</b>',
+        height=600
+        )
+
+    max_y = df[bar_variable].max()
+    fig.update_layout(
+        yaxis=dict(range=[0, max_y * 1.2]),  # Adds 20% extra space above
+        images=BAR_IMAGES_CACHE[(bar_variable, season)]
+        )
+
+    return fig.to_plotly_json()
+
+def create_fig_patch(fig_dict):
+    """
+    Converts a full figure into a Patch touching only the parts that change.
+
+    Returning a `dash.Patch` instead of a whole figure lets the client apply
+    the update through Plotly.react's diffing path rather than destroying and
+    re-rendering the graph from scratch.
+
+    Args:
+        fig_dict (dict): The figure in JSON-ready dict form.
+
+    Returns:
+        dash.Patch: A partial update covering the traces, titles, axis ranges,
+        and layout images.
+    """
+
+    patched = Patch()
+    patched["data"] = fig_dict["data"]
+    patched["layout"]["title"] = fig_dict["layout"]["title"]
+    patched["layout"]["xaxis"] = fig_dict["layout"]["xaxis"]
+    patched["layout"]["yaxis"] = fig_dict["layout"]["yaxis"]
+    patched["layout"]["images"] = fig_dict["layout"].get("images", [])
+    return patched
+
+### Startup caches ###
+# data.json is static for the lifetime of the process (it is only refreshed on
+# startup), so the per-season DataFrames, column definitions, and table records
+# are computed once at import time and served from dict lookups in the callbacks.
+
+# The raw form strings never change after load, so render them to HTML once
+# here instead of re-running create_form on every row of every table rebuild.
+for arrays in SEASON_ARRAYS.values():
+    arrays["form"] = np.array([create_form(form) for form in arrays["form"]], dtype=object)
+
+PLOT_CACHE = {season: create_plot_df(season) for season in SEASON_ARRAYS}
+RECORDS_CACHE = {season: create_table_records(season) for season in SEASON_ARRAYS}
+STYLE_CACHE = {season: create_style_conds(season) for season in SEASON_ARRAYS}
+
+# The table columns are the same for every season
+table_columns = ["Position", "Club", "GP", "W", "D", "L",
+                 "GF", "GA", "GD", "Points", "Form"]
+COLUMNS_LIST = create_columns_list(table_columns)
+
+# The badge image lists only depend on the callback inputs, whose product is
+# small (seasons x plot columns), so they are all generated here once and the
+# figure builders never construct an image dict per interaction.
+SCATTER_IMAGES_CACHE = {
+    (x_axis, y_axis, season): create_scatter_images(x_axis, y_axis, season)
+    for season in SEASON_ARRAYS for x_axis in plot_columns for y_axis in plot_columns
+}
+BAR_IMAGES_CACHE = {
+    (bar_variable, season): create_bar_images(bar_variable, season)
+    for season in SEASON_ARRAYS for bar_variable in plot_columns
+}
+
 def register_callbacks(app):
     """
     Registers Dash callback functions for updating tables and visualizations dynamically.
@@ -307,121 +529,77 @@ def register_callbacks(app):
                 - "standings-table" style_data_conditional (list of dicts).
 
         2. update_scatter_plot(x_axis, y_axis, selected_season):
-            - Generates a scatter plot for selected performance metrics.
-            - Adds club badges as images at corresponding data points.
+            - Builds a scatter plot for selected performance metrics via `create_scatter_fig()`.
             - Outputs:
-                - "scatter-plot" figure (plotly.graph_objects.Figure).
+                - "scatter-plot" figure (dash.Patch with the changed traces and layout fields).
 
         3. update_barplot(bar_variable, selected_season):
-            - Generates a bar plot for a selected variable (e.g., points, goals).
-            - Adds club badges above bars for visual clarity.
+            - Builds a bar plot for a selected variable via `create_bar_fig()`.
             - Outputs:
-                - "bar-plot" figure (plotly.graph_objects.Figure).
+                - "bar-plot" figure (dash.Patch with the changed traces and layout fields).
 
     Notes:
-        - `create_table_df()` is used to generate the table's data.
+        - `create_table_records()` is used to generate the table's data.
         - `create_plot_df()` extracts data and badge URLs for plotting.
         - Club badges are added dynamically to both scatter and bar plots.
         - Uses `plotly.express` for visualization.
     """
 
 
+    # The callback inputs form a small finite product (seasons x plot columns),
+    # so memoizing on them means each combination is only ever computed once.
+    # The data is static per process, so the entries never expire (timeout 0),
+    # and the threshold leaves headroom over SimpleCache's default of 500,
+    # which the ~430 warmed entries would nearly saturate.
+    cache = Cache(app.server, config={
+        "CACHE_TYPE": "SimpleCache",
+        "CACHE_DEFAULT_TIMEOUT": 0,
+        "CACHE_THRESHOLD": 2000,
+    })
+
+    cached_scatter_fig = cache.memoize(timeout=0)(create_scatter_fig)
+    cached_bar_fig = cache.memoize(timeout=0)(create_bar_fig)
+
     @app.callback(
         Output("standings-table", "data"),
         Output("standings-table", "columns"),
         Output("standings-table", "style_data_conditional"),
         [Input("season-dropdown", "value")]
     )
+    @cache.memoize(timeout=0)
     def update_table(selected_season):
-        df = create_table_df(selected_season)
-        table_data = df.to_dict('records')
-        columns = create_columns_list(df)
-        style_conditions = create_style_conds(df)
-        return table_data, columns, style_conditions
+        table_data = RECORDS_CACHE[selected_season]
+        style_conditions = STYLE_CACHE[selected_season]
+        return table_data, COLUMNS_LIST, style_conditions
 
+    # The graphs are given full initial figures in the layout, so these
+    # callbacks only ship the changed traces and layout fields as a Patch.
     @app.callback(
         Output('scatter-plot', 'figure'),
         [Input('x-axis', 'value'),
         Input('y-axis', 'value'),
-        Input('season-dropdown', 'value')]
+        Input('season-dropdown', 'value')],
+        prevent_initial_call=True
     )
     def update_scatter_plot(x_axis, y_axis, selected_season):
-        df, badges = create_plot_df(selected_season)
-
-        # Need to manually set ranges for plot axes to be able 
-        # to change to paper-relative coordinates later
-        range_x = [int(0.9*df[x_axis].min()), int(1.1*df[x_axis].max())]
-        range_y = [int(0.9*df[y_axis].min()), int(1.1*df[y_axis].max())]
-
-        fig = px.scatter(
-            df, x=x_axis, y=y_axis,
-            range_x = range_x, range_y = range_y,
-            title=f'Scatter Plot of <b>{x_axis}</b> vs <b>{y_axis}</b>', 
-            height=600,
-            )
-        
-        fig.update_traces(
-            marker=dict(opacity=0),
-            hoverinfo="none",
-            hovertemplate=f"<b>%{{customdata}}</b><br>{x_axis}: %{{x}}<br>{y_axis}: %{{y}}<extra></extra>",
-            customdata=df["Club"]
-            )
-
-        x_range = fig.layout.xaxis.range  
-        y_range = fig.layout.yaxis.range
-
-        # Function to convert data coordinates to paper-relative coordinates
-        def to_paper_coords(x_data, y_data, x_range, y_range):
-            x_paper = (x_data - x_range[0]) / (x_range[1] - x_range[0])
-            y_paper = (y_data - y_range[0]) / (y_range[1] - y_range[0])
-            return x_paper, y_paper
-
-        for club, x, y in zip(df["Club"], df[x_axis], df[y_axis]):
-            x, y = to_paper_coords(x, y, x_range, y_range)
-            fig.add_layout_image(
-                dict(
-                    source=badges[club],
-                    x=x, y=y,
-                    xref="paper", yref="paper",
-                    sizex=0.1, sizey=0.1,
-                    xanchor="center", yanchor="middle",
-                    layer="above"
-                )
-            )
-
-        return fig
+        return create_fig_patch(cached_scatter_fig(x_axis, y_axis, selected_season))
 
     @app.callback(
         Output('bar-plot', 'figure'),
         [Input('bar-variable', 'value'),
-        Input('season-dropdown', 'value')]
+        Input('season-dropdown', 'value')],
+        prevent_initial_call=True
     )
     def update_barplot(bar_variable, selected_season):
-        df, badges = create_plot_df(selected_season)
-        fig = px.bar(
-            df, x="Club", y=bar_variable,
-            title=f'Bar Plot of <b>{bar_variable}</b>',
-            height=600
-            )
-
-        x_positions = df["Club"] # Stays constant
-        y_positions = df[bar_variable]
-
-        max_y = y_positions.max()
-        fig.update_layout(yaxis=dict(range=[0, max_y * 1.2]))  # Adds 20% extra space above
-        badge_size = max_y*0.1
-
-        for club, x, y in zip(df["Club"], x_positions, y_positions):
-            fig.add_layout_image(
-                dict(
-                    source=badges[club],
-                    x=x,
-                    y=y + max_y*0.01,  # Slightly above the bar
-                    xref="x", yref="y",
-                    sizex=badge_size, sizey=badge_size,
-                    xanchor="center", yanchor="bottom",
-                    layer="above"
-                )
-            )
-
-        return fig
\ No newline at end of file
+        return create_fig_patch(cached_bar_fig(bar_variable, selected_season))
+
+    # Warm the figure caches: the input space is only seasons x plot columns,
+    # so building every combination once at startup means serving traffic
+    # never pays for figure construction. The table outputs are already
+    # precomputed in the startup caches above.
+    for season in SEASON_ARRAYS:
+        for bar_variable in plot_columns:
+            cached_bar_fig(bar_variable, season)
+        for x_axis in plot_columns:
+            for y_axis in plot_columns:
+                cached_scatter_fig(x_axis, y_axis, season)
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+data_store.py
+
+Loads the Premier League standings data exactly once per process and shares
+the parsed object between the modules that need it.
+
+Previously both `app.py` and `callbacks.py` parsed `data.json` separately at
+import time with the stdlib `json` module. Importing `DATA` from this module
+instead means the file is read and parsed a single time, and orjson handles
+the parsing, which is considerably faster than stdlib json for this kind of
+nested structure.
+
+If `data.json` does not exist yet, the data is fetched first via
+`fetch_data.main()`.
+
+The per-club dicts in `DATA` are also transposed once into a columnar
+(struct-of-arrays) layout in `SEASON_ARRAYS`, so downstream consumers can pull
+a whole column as a single numpy array instead of walking 20 dicts and paying
+a hash lookup per field.
+
+Attributes:
+    DATA_FILE_PATH (str): Path to the JSON file holding the standings data.
+    DATA (dict): The parsed standings data, keyed by season.
+    SEASON_ARRAYS (dict): Per-season columnar data, mapping each column name
+        to a numpy array ordered by league position.
+"""
+
+import logging
+import os.path
+import numpy as np
+import orjson
+import requests
+import fetch_data
+
+_log = logging.getLogger(__name__)
+
+INT_COLUMNS = ("played", "won", "drawn", "lost", "goals for", "goals against", "points")
+STR_COLUMNS = ("club", "badge_url", "form")
+
+DATA_FILE_PATH = "data.json"
+
+# Prevents the program from continuously fetching data
+if not os.path.exists(DATA_FILE_PATH):
+    fetch_data.main()
+
+with open(DATA_FILE_PATH, "rb") as f:
+    DATA = orjson.loads(f.read())
+
+def _build_season_arrays(season_data):
+    """
+    Wraps one season's columnar data in numpy arrays.
+
+    The fetch script already writes each season as one list per column, so
+    this is a direct array conversion; seasons from files written in the old
+    rank-keyed format are transposed first via `fetch_data.to_columnar`.
+
+    Args:
+        season_data (dict): Per-column season data.
+
+    Returns:
+        dict: A mapping of column name to numpy array, ordered by position.
+    """
+
+    season_data = fetch_data.to_columnar(season_data)
+    # int32 halves the memory of the numeric columns and is plenty for
+    # football statistics; asarray avoids copying already-typed input
+    arrays = {"position": np.asarray(season_data["position"], dtype=np.int32)}
+    for col in INT_COLUMNS:
+        arrays[col] = np.asarray(season_data[col], dtype=np.int32)
+    for col in STR_COLUMNS:
+        arrays[col] = np.asarray(season_data[col], dtype=object)
+    return arrays
+
+SEASON_ARRAYS = {season: _build_season_arrays(season_data) for season, season_data in DATA.items()}
+
+BADGE_DIR = os.path.join("assets", "badges")
+
+def _localize_badge(url, session):
+    """
+    Downloads a club badge once into `assets/badges` and returns its local path.
+
+    Serving the badges from the app's own assets means the browser makes a
+    single request per badge ever (and caches it), instead of re-fetching
+    ~20 external images every time a plot is rendered. If the download fails
+    the original URL is returned so the app still works with remote badges.
+
+    Args:
+        url (str): The remote badge URL from the SportsDB API.
+        session (requests.Session): The session used for the downloads.
+
+    Returns:
+        str: A path under `assets/badges`, or the original URL on failure.
+    """
+
+    if not url:
+        return url
+    filename = url.split("?")[0].rsplit("/", 1)[-1]
+    local_path = os.path.join(BADGE_DIR, filename)
+    if not os.path.exists(local_path):
+        try:
+            response = session.get(url, timeout=10)
+            response.raise_for_status()
+            with open(local_path, "wb") as f:
+                f.write(response.content)
+        except Exception as e:
+            _log.warning("Could not cache badge from %s: %s", url, e)
+            return url
+    return f"assets/badges/{filename}"
+
+def _localize_badges():
+    """Replaces the badge URLs in `SEASON_ARRAYS` with locally cached copies."""
+
+    os.makedirs(BADGE_DIR, exist_ok=True)
+    session = requests.Session()
+    local_paths = {}
+    for arrays in SEASON_ARRAYS.values():
+        # setdefault would call _localize_badge eagerly for every occurrence;
+        # the explicit guard ensures each unique URL (including failed
+        # downloads) is attempted only once per run
+        for url in arrays["badge_url"]:
+            if url not in local_paths:
+                local_paths[url] = _localize_badge(url, session)
+        arrays["badge_url"] = np.array(
+            [local_paths[url] for url in arrays["badge_url"]],
+            dtype=object
+        )
+    session.close()
+
+_localize_badges()